@@ -1,8 +1,12 @@
 """PyPI-related functionality"""
 
 import ast
+import re
 import subprocess
+import threading
 import urllib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 
 import requests
@@ -10,6 +14,13 @@ import requirements
 
 from utils import clean_github_link
 
+# number of concurrent requests made to the PyPI JSON API
+MAX_PYPI_WORKERS = 32
+
+# first whitespace-delimited token mentioning github.com
+# (anchored to token starts so long whitespace-free runs scan in linear time)
+GITHUB_MENTION_PATTERN = re.compile(r"(?<!\S)\S*github\.com\S*")
+
 
 def python_requirements_dot_text_analysis(filepath, no_deps):
     """Execute overall analysis of Python's requirements.txt
@@ -48,9 +59,9 @@ def python_requirements_dot_text_analysis(filepath, no_deps):
     github_urls = []
     pkgs_without_pypi_data = []
     pkgs_without_githubs = []
-    for pkg in all_pkgs:
+    pypi_jsons = get_pypi_data_jsons(all_pkgs)
+    for pkg, pypi_json in zip(all_pkgs, pypi_jsons):
 
-        pypi_json = get_pypi_data_json(pkg)
         if not pypi_json:
             pkgs_without_pypi_data.append(pkg)
 
@@ -129,18 +140,22 @@ def get_pypi_package_dependencies(pkg):
     return dict_result
 
 
-def get_pypi_data_json(pkg):
+def get_pypi_data_json(pkg, session=None):
     """Return PyPI json associated with a python package.
 
     Args:
         pkg (str): the name of a python package found on PyPI
+        session (requests.Session): optional session to reuse connections
 
     Returns:
         dict: data related to a PyPI package
     """
     try:
         pkg_url = "https://pypi.org/pypi/" + pkg + "/json"
-        response = requests.get(pkg_url)
+        if session is None:
+            response = requests.get(pkg_url)
+        else:
+            response = session.get(pkg_url)
         pypi_pkg_json = response.json()
     # if no package found, return empty json
     except urllib.error.HTTPError:
@@ -149,6 +164,57 @@ def get_pypi_data_json(pkg):
     return pypi_pkg_json
 
 
+def get_pypi_data_jsons(pkgs):
+    """Return PyPI jsons for several python packages, fetched concurrently.
+
+    Requests are issued from a thread pool so that total wall time is
+    not the sum of every round trip to PyPI. Each worker thread keeps
+    its own session, since requests sessions are not thread-safe.
+
+    Args:
+        pkgs (list of str): names of python packages found on PyPI
+
+    Returns:
+        list of dict: PyPI data for each package, in the order of pkgs
+    """
+    if not pkgs:
+        return []
+
+    thread_state = threading.local()
+    sessions = []
+    fetch = partial(
+        _get_pypi_data_json_in_thread, thread_state=thread_state, sessions=sessions
+    )
+    try:
+        workers = min(MAX_PYPI_WORKERS, len(pkgs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pypi_jsons = list(executor.map(fetch, pkgs))
+    finally:
+        for session in sessions:
+            session.close()
+
+    return pypi_jsons
+
+
+def _get_pypi_data_json_in_thread(pkg, thread_state, sessions):
+    """Fetch PyPI json using a session private to the calling thread.
+
+    Args:
+        pkg (str): the name of a python package found on PyPI
+        thread_state (threading.local): holds the per-thread session
+        sessions (list): every session created, so the caller can close them
+
+    Returns:
+        dict: data related to a PyPI package
+    """
+    session = getattr(thread_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        thread_state.session = session
+        sessions.append(session)
+    return get_pypi_data_json(pkg, session=session)
+
+
 def get_github_url_from_pypi_json(pypi_pkg_json):
     """Retrieve GitHub URL associated with a PyPI json.
 
@@ -161,31 +227,28 @@ def get_github_url_from_pypi_json(pypi_pkg_json):
     Returns:
         str: GitHub URL
     """
-    github_page = ""
     potential_github_fields = []
+    info = pypi_pkg_json["info"]
 
     # check home page url
-    if "github.com" in pypi_pkg_json["info"]["home_page"]:
-        potential_github_fields.append(pypi_pkg_json["info"]["home_page"])
+    if "github.com" in info["home_page"]:
+        potential_github_fields.append(info["home_page"])
 
     # check project url fields if url fields present
-    if pypi_pkg_json["info"]["project_urls"]:
-        for _, url in pypi_pkg_json["info"]["project_urls"].items():
+    if info["project_urls"]:
+        for _, url in info["project_urls"].items():
             if "github.com" in url:
                 potential_github_fields.append(url)
 
     # check PyPI description text for any GitHub mentions
-    description = pypi_pkg_json["info"]["description"]
+    description = info["description"]
     if potential_github_fields == [] and description:
-        for token in description.split():
-            if "github.com" in token:
-                potential_github_fields.append(token)
-
-    for field in potential_github_fields:
-        # Any field with github in it must be github link
-        if "github" in field:
-            github_page = field
-            break
+        match = GITHUB_MENTION_PATTERN.search(description)
+        if match:
+            potential_github_fields.append(match.group(0))
+
+    # every candidate already mentions github.com, so take the first
+    github_page = potential_github_fields[0] if potential_github_fields else ""
 
     if github_page:
         github_page = clean_github_link(github_page)
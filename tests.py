@@ -12,6 +12,7 @@ from julia import (
 from pypi import (
     get_github_url_from_pypi_json,
     get_pypi_data_json,
+    get_pypi_data_jsons,
     get_pypi_package_dependencies,
     parse_requirements_dot_text,
 )
@@ -36,6 +37,14 @@ class TestPypiMethods(unittest.TestCase):
         self.networkml_test_json = get_pypi_data_json("networkml")
         self.assertTrue(self.networkml_test_json)
 
+    def test_get_pypi_data_jsons(self):
+        """Check concurrent PyPI API calls return JSON in input order."""
+        self.test_jsons = get_pypi_data_jsons(["requests", "networkml"])
+        self.assertEqual(len(self.test_jsons), 2)
+        self.assertEqual(self.test_jsons[0]["info"]["name"], "requests")
+        self.assertEqual(self.test_jsons[1]["info"]["name"], "networkml")
+        self.assertEqual(get_pypi_data_jsons([]), [])
+
     def test_get_github_url_from_pypi_json(self):
         """Check that GitHub link is returned from PyPI API json."""
         self.requests_test_json = get_pypi_data_json("requests")
@@ -49,6 +58,27 @@ class TestPypiMethods(unittest.TestCase):
             "https://github.com/IQTLabs/NetworkML",
         )
 
+    def test_get_github_url_from_pypi_json_description(self):
+        """Check that GitHub link is found in PyPI description text."""
+        self.test_json = {
+            "info": {
+                "home_page": "https://example.com",
+                "project_urls": None,
+                "description": "Docs at example.com.\n"
+                "Source: https://github.com/IQTLabs/deps2repos/issues and "
+                "https://github.com/psf/requests",
+            }
+        }
+        self.assertEqual(
+            get_github_url_from_pypi_json(self.test_json),
+            "https://github.com/IQTLabs/deps2repos",
+        )
+        # long whitespace-free run, e.g. an inline base64 image
+        self.test_json["info"]["description"] = (
+            "data:image/png;base64," + "A" * 50000
+        )
+        self.assertEqual(get_github_url_from_pypi_json(self.test_json), "")
+
     def test_get_pypi_package_dependencies(self):
         """Check that pipgrip produces dependency list."""
         self.requests_test_deps = get_pypi_package_dependencies("requests")